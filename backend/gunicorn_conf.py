@@ -0,0 +1,19 @@
+"""Gunicorn configuration for multi-worker deployment.
+
+Run with:
+
+    gunicorn server:app -c gunicorn_conf.py
+
+A single Uvicorn process uses one core no matter the load, so this runs one
+Uvicorn worker per the 2*cores+1 rule. Cross-request state is safe to shard:
+the prompt and session-existence caches live in Redis and are shared by all
+workers, while the per-session LlmChat pool is worker-local by design. The
+Motor client is created at import time, i.e. in each worker after fork, so
+there is no fork-before-connect hazard.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
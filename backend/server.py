@@ -1,16 +1,25 @@
 from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import hashlib
 import logging
+import time
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional
 import uuid
+import orjson
 from datetime import datetime
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 import asyncio
+import redis.asyncio as aioredis
+from cachetools import TTLCache
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -20,15 +29,94 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Redis connection (caching); every cache helper degrades gracefully when
+# Redis is unreachable, so it is an optimization rather than a dependency
+redis_client = aioredis.from_url(
+    os.environ.get('REDIS_URL', 'redis://localhost:6379'),
+    decode_responses=True,
+)
+
+GEMINI_MODEL = "gemini-2.5-pro-preview-05-06"
+
+# Keep the system message a byte-stable module constant: Gemini's implicit
+# prefix caching keys on the exact prompt head, so the static instructions go
+# first and only the transcript context + question vary per request. (The
+# explicit CachedContent API is not exposed through LlmChat.)
+SYSTEM_MESSAGE = """You are an expert interview copilot assistant. Your role is to help the interviewee answer questions professionally and effectively.
+
+When given an interview question, provide:
+1. A clear, concise, and professional answer
+2. Key points to emphasize
+3. Examples or experiences to mention if relevant
+
+Keep responses natural, authentic, and appropriate for a professional interview setting.
+Format your response to be easy to read quickly during an interview.
+
+Structure your response as:
+**Main Answer:** [Direct response to the question]
+**Key Points:** [2-3 bullet points of important aspects to mention]
+**Example/Experience:** [If relevant, suggest a brief example to share]"""
+
+# Prompt cache: interview questions repeat heavily across sessions, so a
+# cached answer keyed on the normalized question skips the Gemini round-trip
+# entirely. Keys are namespaced by model so a model change invalidates them.
+PROMPT_CACHE_TTL = 3600
+
+def _prompt_cache_key(question: str) -> str:
+    normalized = " ".join(question.lower().split())
+    digest = hashlib.sha256(f"{GEMINI_MODEL}\n{SYSTEM_MESSAGE}\n{normalized}".encode()).hexdigest()
+    return f"prompt_cache:{digest}"
+
+async def get_cached_ai_response(question: str) -> Optional[str]:
+    try:
+        return await redis_client.get(_prompt_cache_key(question))
+    except Exception as e:
+        logging.warning(f"Prompt cache lookup failed: {e}")
+        return None
+
+async def cache_ai_response(question: str, response: str):
+    try:
+        await redis_client.set(_prompt_cache_key(question), response, ex=PROMPT_CACHE_TTL)
+    except Exception as e:
+        logging.warning(f"Prompt cache store failed: {e}")
+
+# Session-existence cache: the write endpoints only need to know that the
+# session exists, not its contents, so a Redis flag replaces the extra Mongo
+# round-trip on every transcript and AI-response request
+SESSION_CACHE_TTL = 86400
+
+async def mark_session_exists(session_id: str):
+    try:
+        await redis_client.set(f"session:{session_id}", 1, ex=SESSION_CACHE_TTL)
+    except Exception as e:
+        logging.warning(f"Session cache store failed: {e}")
+
+async def session_exists(session_id: str) -> bool:
+    try:
+        if await redis_client.exists(f"session:{session_id}"):
+            return True
+    except Exception as e:
+        logging.warning(f"Session cache lookup failed: {e}")
+    session = await db.interview_sessions.find_one({"id": session_id}, {"_id": 1})
+    if session:
+        await mark_session_exists(session_id)
+    return session is not None
+
+class ApiJSONResponse(ORJSONResponse):
+    """ORJSONResponse with a fallback serializer for datetime/UUID/ObjectId values."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str)
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ApiJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # Models
 class InterviewSession(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
 
@@ -36,7 +124,7 @@ class InterviewSessionCreate(BaseModel):
     pass  # No additional fields needed for creation
 
 class TranscriptEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     session_id: str
     text: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
@@ -48,7 +136,7 @@ class TranscriptCreate(BaseModel):
     speaker: str = "interviewer"
 
 class AIResponse(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     session_id: str
     question: str
     response: str
@@ -59,7 +147,7 @@ class AIResponseRequest(BaseModel):
     question: str
 
 class StatusCheck(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     client_name: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
@@ -70,105 +158,219 @@ class StatusCheckCreate(BaseModel):
 @api_router.post("/interview/session", response_model=InterviewSession)
 async def create_interview_session(input: InterviewSessionCreate):
     session_obj = InterviewSession()
-    await db.interview_sessions.insert_one(session_obj.dict())
+    await db.interview_sessions.insert_one(session_obj.model_dump())
+    await mark_session_exists(session_obj.id)
     return session_obj
 
 @api_router.get("/interview/session/{session_id}", response_model=InterviewSession)
 async def get_interview_session(session_id: str):
-    session = await db.interview_sessions.find_one({"id": session_id})
+    session = await db.interview_sessions.find_one({"id": session_id}, {"_id": 0})
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return InterviewSession(**session)
 
-@api_router.get("/interview/sessions", response_model=List[InterviewSession])
+# The list endpoints return trusted, already-projected documents straight
+# from Mongo, so response_model validation would only re-check our own
+# writes; response_model=None skips that second validation pass entirely
+@api_router.get("/interview/sessions", response_model=None)
 async def get_all_sessions():
-    sessions = await db.interview_sessions.find().to_list(100)
-    return [InterviewSession(**session) for session in sessions]
+    # Return the raw documents and let orjson serialize them; re-instantiating
+    # a model per document only re-validates data we just wrote ourselves
+    sessions = await db.interview_sessions.find({}, {"_id": 0}).to_list(100)
+    return ApiJSONResponse(content=sessions)
 
 # Transcript Management
 @api_router.post("/interview/transcript", response_model=TranscriptEntry)
 async def add_transcript(input: TranscriptCreate):
-    # Verify session exists
-    session = await db.interview_sessions.find_one({"id": input.session_id})
-    if not session:
+    transcript_obj = TranscriptEntry(**input.model_dump())
+
+    # Run the session check and the insert concurrently instead of paying two
+    # sequential round-trips; the insert is rolled back on the rare miss
+    exists, _ = await asyncio.gather(
+        session_exists(input.session_id),
+        db.transcripts.insert_one(transcript_obj.model_dump())
+    )
+    if not exists:
+        await db.transcripts.delete_one({"id": transcript_obj.id})
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    transcript_obj = TranscriptEntry(**input.dict())
-    await db.transcripts.insert_one(transcript_obj.dict())
     return transcript_obj
 
-@api_router.get("/interview/transcript/{session_id}", response_model=List[TranscriptEntry])
+@api_router.post("/interview/transcripts:batch", response_model=None)
+async def add_transcripts_batch(inputs: List[TranscriptCreate]):
+    """Insert a batch of transcript entries in one round-trip.
+
+    Speech-to-text frontends produce transcripts in bursts; posting them here
+    costs one session check and one insert_many instead of a verify+insert
+    pair per entry.
+    """
+    if not inputs:
+        return ApiJSONResponse(content=[])
+
+    session_ids = {t.session_id for t in inputs}
+    checks = await asyncio.gather(*[session_exists(sid) for sid in session_ids])
+    if not all(checks):
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    transcript_objs = [TranscriptEntry(**t.model_dump()) for t in inputs]
+    await db.transcripts.insert_many(
+        [t.model_dump() for t in transcript_objs], ordered=False
+    )
+    return ApiJSONResponse(content=[t.model_dump() for t in transcript_objs])
+
+@api_router.get("/interview/transcript/{session_id}", response_model=None)
 async def get_session_transcripts(session_id: str):
-    transcripts = await db.transcripts.find({"session_id": session_id}).sort("timestamp", 1).to_list(1000)
-    return [TranscriptEntry(**transcript) for transcript in transcripts]
+    transcripts = await db.transcripts.find(
+        {"session_id": session_id},
+        {"id": 1, "session_id": 1, "text": 1, "timestamp": 1, "speaker": 1, "_id": 0}
+    ).sort("timestamp", 1).to_list(1000)
+    return ApiJSONResponse(content=transcripts)
 
 # AI Response Generation
+async def get_session_context(session_id: str) -> str:
+    """Build the conversation context block from the most recent transcripts."""
+    # Three turns are enough signal for a follow-up answer; every extra turn
+    # is tokens billed and time-to-first-token on the Gemini side
+    recent_transcripts = await db.transcripts.find(
+        {"session_id": session_id},
+        {"speaker": 1, "text": 1, "_id": 0}
+    ).sort("timestamp", -1).limit(3).to_list(3)
+
+    return "Recent interview conversation:\n" + "\n".join(
+        f"{t['speaker']}: {t['text']}" for t in reversed(recent_transcripts)
+    )
+
+def build_gemini_chat(session_id: str) -> LlmChat:
+    return LlmChat(
+        api_key=os.environ.get('GEMINI_API_KEY'),
+        session_id=session_id,
+        system_message=SYSTEM_MESSAGE
+    ).with_model("gemini", GEMINI_MODEL).with_max_tokens(1024)
+
+# Reuse one LlmChat per session: skips per-request construction and keeps the
+# provider's prefix cache pinned to a stable session id. TTL eviction bounds
+# memory for long-running workers.
+_chat_pool = TTLCache(maxsize=10_000, ttl=3600)
+_chat_pool_lock = asyncio.Lock()
+
+async def get_gemini_chat(session_id: str) -> LlmChat:
+    async with _chat_pool_lock:
+        chat = _chat_pool.get(session_id)
+        if chat is None:
+            chat = build_gemini_chat(session_id)
+            _chat_pool[session_id] = chat
+        return chat
+
+def build_prompt(context: str, question: str) -> str:
+    return f"{context}\n\nCurrent Question: {question}\n\nPlease provide a professional interview response:"
+
+async def save_ai_response(session_id: str, question: str, response_text: str) -> AIResponse:
+    response_obj = AIResponse(
+        session_id=session_id,
+        question=question,
+        response=response_text
+    )
+    await db.ai_responses.insert_one(response_obj.model_dump())
+    return response_obj
+
 @api_router.post("/interview/ai-response", response_model=AIResponse)
 async def generate_ai_response(input: AIResponseRequest):
     try:
-        # Verify session exists
-        session = await db.interview_sessions.find_one({"id": input.session_id})
-        if not session:
+        # Overlap the session check, prompt-cache lookup and context fetch
+        # instead of paying three sequential round-trips
+        exists, cached_response, context = await asyncio.gather(
+            session_exists(input.session_id),
+            get_cached_ai_response(input.question),
+            get_session_context(input.session_id)
+        )
+        if not exists:
             raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Get session context (recent transcripts)
-        recent_transcripts = await db.transcripts.find(
-            {"session_id": input.session_id}
-        ).sort("timestamp", -1).limit(5).to_list(5)
-        
-        # Prepare context for AI
-        context = "Recent interview conversation:\n"
-        for transcript in reversed(recent_transcripts):
-            context += f"{transcript['speaker']}: {transcript['text']}\n"
-        
-        # Create system message for interview assistance
-        system_message = """You are an expert interview copilot assistant. Your role is to help the interviewee answer questions professionally and effectively.
 
-When given an interview question, provide:
-1. A clear, concise, and professional answer
-2. Key points to emphasize
-3. Examples or experiences to mention if relevant
-
-Keep responses natural, authentic, and appropriate for a professional interview setting. 
-Format your response to be easy to read quickly during an interview.
-
-Structure your response as:
-**Main Answer:** [Direct response to the question]
-**Key Points:** [2-3 bullet points of important aspects to mention]
-**Example/Experience:** [If relevant, suggest a brief example to share]"""
+        # Serve repeated questions straight from the prompt cache
+        if cached_response is not None:
+            return await save_ai_response(input.session_id, input.question, cached_response)
 
         # Initialize Gemini chat
-        chat = LlmChat(
-            api_key=os.environ.get('GEMINI_API_KEY'),
-            session_id=input.session_id,
-            system_message=system_message
-        ).with_model("gemini", "gemini-2.5-pro-preview-05-06").with_max_tokens(1024)
-        
+        chat = await get_gemini_chat(input.session_id)
+
         # Create user message with context and question
-        full_prompt = f"{context}\n\nCurrent Question: {input.question}\n\nPlease provide a professional interview response:"
-        user_message = UserMessage(text=full_prompt)
-        
+        user_message = UserMessage(text=build_prompt(context, input.question))
+
         # Get AI response
         ai_response_text = await chat.send_message(user_message)
-        
+        await cache_ai_response(input.question, ai_response_text)
+
         # Save the AI response
-        response_obj = AIResponse(
-            session_id=input.session_id,
-            question=input.question,
-            response=ai_response_text
-        )
-        await db.ai_responses.insert_one(response_obj.dict())
-        
-        return response_obj
-        
+        return await save_ai_response(input.session_id, input.question, ai_response_text)
+
     except Exception as e:
         logging.error(f"Error generating AI response: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate AI response: {str(e)}")
 
-@api_router.get("/interview/ai-responses/{session_id}", response_model=List[AIResponse])
+@api_router.post("/interview/ai-response/stream")
+async def stream_ai_response(input: AIResponseRequest):
+    """Stream the Gemini answer as server-sent events.
+
+    The buffered /interview/ai-response endpoint makes the client wait for the
+    full completion; this one yields tokens as they arrive so first output
+    lands in hundreds of milliseconds instead of seconds.
+    """
+    exists, cached_response, context = await asyncio.gather(
+        session_exists(input.session_id),
+        get_cached_ai_response(input.question),
+        get_session_context(input.session_id)
+    )
+    if not exists:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    # Filled in by the generator before it emits [DONE]; persisted by the
+    # response background task, which runs even if the client hangs up the
+    # moment it sees [DONE] — awaits placed after the final yield would be
+    # cancelled along with the generator on disconnect.
+    result = {"text": None, "from_cache": cached_response is not None}
+
+    async def token_stream():
+        if cached_response is not None:
+            result["text"] = cached_response
+            yield f"data: {orjson.dumps({'text': cached_response}).decode()}\n\n"
+            yield "data: [DONE]\n\n"
+            return
+
+        chat = await get_gemini_chat(input.session_id)
+        user_message = UserMessage(text=build_prompt(context, input.question))
+        chunks = []
+        try:
+            async for chunk in chat.stream_message(user_message):
+                chunks.append(chunk)
+                yield f"data: {orjson.dumps({'text': chunk}).decode()}\n\n"
+        except Exception as e:
+            logging.error(f"Error streaming AI response: {str(e)}")
+            yield f"data: {orjson.dumps({'error': str(e)}).decode()}\n\n"
+            return
+
+        result["text"] = "".join(chunks)
+        yield "data: [DONE]\n\n"
+
+    async def persist():
+        if result["text"] is None:
+            # Stream failed or was cut off mid-answer; nothing complete to save
+            return
+        if not result["from_cache"]:
+            await cache_ai_response(input.question, result["text"])
+        await save_ai_response(input.session_id, input.question, result["text"])
+
+    return StreamingResponse(
+        token_stream(),
+        media_type="text/event-stream",
+        background=BackgroundTask(persist)
+    )
+
+@api_router.get("/interview/ai-responses/{session_id}", response_model=None)
 async def get_session_ai_responses(session_id: str):
-    responses = await db.ai_responses.find({"session_id": session_id}).sort("timestamp", 1).to_list(1000)
-    return [AIResponse(**response) for response in responses]
+    responses = await db.ai_responses.find(
+        {"session_id": session_id},
+        {"id": 1, "session_id": 1, "question": 1, "response": 1, "timestamp": 1, "_id": 0}
+    ).sort("timestamp", 1).to_list(1000)
+    return ApiJSONResponse(content=responses)
 
 # Original status endpoints
 @api_router.get("/")
@@ -177,19 +379,93 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
+    status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    _ = await db.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
-@api_router.get("/status", response_model=List[StatusCheck])
+@api_router.get("/status", response_model=None)
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
+    return ApiJSONResponse(content=status_checks)
 
 # Include the router in the main app
 app.include_router(api_router)
 
+class AccessTimingMiddleware:
+    """Raw ASGI middleware that logs request timing without buffering.
+
+    Middleware in this app must stay pure ASGI: BaseHTTPMiddleware re-buffers
+    request and response bodies, which adds per-request overhead and would
+    break the streaming AI-response endpoint. Observe the response by wrapping
+    ``send`` instead.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and not message.get("more_body"):
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                logging.info(f"{scope['method']} {scope['path']} -> {status_code} in {elapsed_ms:.1f}ms")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+app.add_middleware(AccessTimingMiddleware)
+
+class SSEPassthroughGZipResponder(GZipResponder):
+    """GZipResponder that leaves ``text/event-stream`` responses untouched.
+
+    Starlette's responder feeds streamed chunks into one GzipFile and only
+    flushes the deflate stream at close, so a compressed SSE response delivers
+    nothing until generation finishes — the streaming endpoint would silently
+    degrade to a buffered one for any client sending Accept-Encoding: gzip.
+    """
+
+    def __init__(self, app, minimum_size, compresslevel=9):
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        self.passthrough = False
+
+    async def send_with_gzip(self, message):
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.passthrough = content_type.startswith("text/event-stream")
+        if self.passthrough:
+            await self.send(message)
+        else:
+            await super().send_with_gzip(message)
+
+class SSEAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware wired to the event-stream-exempt responder."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = SSEPassthroughGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+# Transcript/AI-response lists compress 5-10x; responses under minimum_size
+# skip the deflate pass entirely. SSE responses are exempted above so each
+# event still reaches the client as it is generated.
+app.add_middleware(SSEAwareGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -205,6 +481,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_db_indexes():
+    # Every read path filters on session_id and sorts on timestamp, and the
+    # existence checks look up sessions by their business key "id" — index
+    # both so they run as index scans instead of collection scans
+    await db.transcripts.create_index([("session_id", 1), ("timestamp", 1)])
+    await db.ai_responses.create_index([("session_id", 1), ("timestamp", 1)])
+    await db.interview_sessions.create_index("id", unique=True)
+
+@app.on_event("startup")
+async def warm_connections():
+    # Pay the connection-establishment costs here rather than on the first
+    # user request: Motor opens its pool lazily, Redis connects on first use,
+    # and Gemini negotiates TLS on the first send_message
+    try:
+        await db.command("ping")
+    except Exception as e:
+        logging.warning(f"Mongo warmup failed: {e}")
+    try:
+        await redis_client.ping()
+    except Exception as e:
+        logging.warning(f"Redis warmup failed: {e}")
+    if os.environ.get('GEMINI_API_KEY'):
+        try:
+            chat = LlmChat(
+                api_key=os.environ.get('GEMINI_API_KEY'),
+                session_id="startup-warmup",
+                system_message="Reply with the single word: pong"
+            ).with_model("gemini", GEMINI_MODEL).with_max_tokens(1)
+            await chat.send_message(UserMessage(text="ping"))
+        except Exception as e:
+            logging.warning(f"Gemini warmup failed: {e}")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools replace the default asyncio selector loop and h11
+    # parser; every handler here is I/O-bound so the loop is on the hot path
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
\ No newline at end of file
@@ -4,25 +4,29 @@ Comprehensive Backend API Testing for Interview Copilot
 Tests all backend endpoints with realistic interview scenarios
 """
 
-import requests
+import asyncio
 import json
-import time
 from datetime import datetime
 import sys
 
+import httpx
+
 # Backend URL from frontend/.env
 BACKEND_URL = "https://f581555b-dca5-41e2-b7a5-b4ee9f25f8c2.preview.emergentagent.com/api"
 
 class InterviewCopilotTester:
-    def __init__(self):
+    def __init__(self, client):
+        self.client = client
         self.session_id = None
+        # Fan out at most 2 concurrent AI requests to stay under provider rate limits
+        self.ai_semaphore = asyncio.Semaphore(2)
         self.test_results = {
             "session_management": {"passed": 0, "failed": 0, "errors": []},
             "transcript_management": {"passed": 0, "failed": 0, "errors": []},
             "ai_integration": {"passed": 0, "failed": 0, "errors": []},
             "error_handling": {"passed": 0, "failed": 0, "errors": []}
         }
-    
+
     def log_result(self, category, test_name, success, error_msg=None):
         """Log test results"""
         if success:
@@ -32,14 +36,14 @@ class InterviewCopilotTester:
             self.test_results[category]["failed"] += 1
             self.test_results[category]["errors"].append(f"{test_name}: {error_msg}")
             print(f"❌ {test_name}: {error_msg}")
-    
-    def test_session_management(self):
+
+    async def test_session_management(self):
         """Test interview session management endpoints"""
         print("\n🔍 Testing Session Management APIs...")
-        
+
         # Test 1: Create new session
         try:
-            response = requests.post(f"{BACKEND_URL}/interview/session", json={})
+            response = await self.client.post(f"{BACKEND_URL}/interview/session", json={})
             if response.status_code == 200:
                 session_data = response.json()
                 self.session_id = session_data["id"]
@@ -51,11 +55,13 @@ class InterviewCopilotTester:
                 self.log_result("session_management", "Create new session", False, f"HTTP {response.status_code}: {response.text}")
         except Exception as e:
             self.log_result("session_management", "Create new session", False, str(e))
-        
-        # Test 2: Get specific session
-        if self.session_id:
+
+        # Tests 2+3: Get specific session and get all sessions, in parallel
+        async def get_specific_session():
+            if not self.session_id:
+                return
             try:
-                response = requests.get(f"{BACKEND_URL}/interview/session/{self.session_id}")
+                response = await self.client.get(f"{BACKEND_URL}/interview/session/{self.session_id}")
                 if response.status_code == 200:
                     session_data = response.json()
                     if session_data["id"] == self.session_id:
@@ -66,29 +72,31 @@ class InterviewCopilotTester:
                     self.log_result("session_management", "Get specific session", False, f"HTTP {response.status_code}: {response.text}")
             except Exception as e:
                 self.log_result("session_management", "Get specific session", False, str(e))
-        
-        # Test 3: Get all sessions
-        try:
-            response = requests.get(f"{BACKEND_URL}/interview/sessions")
-            if response.status_code == 200:
-                sessions = response.json()
-                if isinstance(sessions, list) and len(sessions) > 0:
-                    self.log_result("session_management", "Get all sessions", True)
+
+        async def get_all_sessions():
+            try:
+                response = await self.client.get(f"{BACKEND_URL}/interview/sessions")
+                if response.status_code == 200:
+                    sessions = response.json()
+                    if isinstance(sessions, list) and len(sessions) > 0:
+                        self.log_result("session_management", "Get all sessions", True)
+                    else:
+                        self.log_result("session_management", "Get all sessions", False, "No sessions returned or invalid format")
                 else:
-                    self.log_result("session_management", "Get all sessions", False, "No sessions returned or invalid format")
-            else:
-                self.log_result("session_management", "Get all sessions", False, f"HTTP {response.status_code}: {response.text}")
-        except Exception as e:
-            self.log_result("session_management", "Get all sessions", False, str(e))
-    
-    def test_transcript_management(self):
+                    self.log_result("session_management", "Get all sessions", False, f"HTTP {response.status_code}: {response.text}")
+            except Exception as e:
+                self.log_result("session_management", "Get all sessions", False, str(e))
+
+        await asyncio.gather(get_specific_session(), get_all_sessions())
+
+    async def test_transcript_management(self):
         """Test transcript management endpoints"""
         print("\n🔍 Testing Transcript Management APIs...")
-        
+
         if not self.session_id:
             self.log_result("transcript_management", "All transcript tests", False, "No valid session ID available")
             return
-        
+
         # Realistic interview transcript data
         transcript_entries = [
             {"session_id": self.session_id, "text": "Tell me about yourself and your background in software development.", "speaker": "interviewer"},
@@ -96,27 +104,29 @@ class InterviewCopilotTester:
             {"session_id": self.session_id, "text": "What's your experience with database design and optimization?", "speaker": "interviewer"},
             {"session_id": self.session_id, "text": "I've worked extensively with both SQL and NoSQL databases, including PostgreSQL and MongoDB.", "speaker": "user"}
         ]
-        
-        # Test 1: Add transcript entries
+
+        # Test 1: Add transcript entries — fan out the independent POSTs
+        responses = await asyncio.gather(
+            *[self.client.post(f"{BACKEND_URL}/interview/transcript", json=entry) for entry in transcript_entries],
+            return_exceptions=True
+        )
         added_transcripts = []
-        for i, entry in enumerate(transcript_entries):
-            try:
-                response = requests.post(f"{BACKEND_URL}/interview/transcript", json=entry)
-                if response.status_code == 200:
-                    transcript_data = response.json()
-                    if "id" in transcript_data and transcript_data["session_id"] == self.session_id:
-                        added_transcripts.append(transcript_data)
-                        self.log_result("transcript_management", f"Add transcript entry {i+1}", True)
-                    else:
-                        self.log_result("transcript_management", f"Add transcript entry {i+1}", False, "Invalid transcript data returned")
+        for i, response in enumerate(responses):
+            if isinstance(response, Exception):
+                self.log_result("transcript_management", f"Add transcript entry {i+1}", False, str(response))
+            elif response.status_code == 200:
+                transcript_data = response.json()
+                if "id" in transcript_data and transcript_data["session_id"] == self.session_id:
+                    added_transcripts.append(transcript_data)
+                    self.log_result("transcript_management", f"Add transcript entry {i+1}", True)
                 else:
-                    self.log_result("transcript_management", f"Add transcript entry {i+1}", False, f"HTTP {response.status_code}: {response.text}")
-            except Exception as e:
-                self.log_result("transcript_management", f"Add transcript entry {i+1}", False, str(e))
-        
+                    self.log_result("transcript_management", f"Add transcript entry {i+1}", False, "Invalid transcript data returned")
+            else:
+                self.log_result("transcript_management", f"Add transcript entry {i+1}", False, f"HTTP {response.status_code}: {response.text}")
+
         # Test 2: Get session transcripts
         try:
-            response = requests.get(f"{BACKEND_URL}/interview/transcript/{self.session_id}")
+            response = await self.client.get(f"{BACKEND_URL}/interview/transcript/{self.session_id}")
             if response.status_code == 200:
                 transcripts = response.json()
                 if isinstance(transcripts, list) and len(transcripts) >= len(added_transcripts):
@@ -131,31 +141,32 @@ class InterviewCopilotTester:
                 self.log_result("transcript_management", "Get session transcripts", False, f"HTTP {response.status_code}: {response.text}")
         except Exception as e:
             self.log_result("transcript_management", "Get session transcripts", False, str(e))
-    
-    def test_ai_integration(self):
+
+    async def test_ai_integration(self):
         """Test Gemini AI integration and response generation"""
         print("\n🔍 Testing AI Integration and Response Generation...")
-        
+
         if not self.session_id:
             self.log_result("ai_integration", "All AI tests", False, "No valid session ID available")
             return
-        
+
         # Test realistic interview questions
         test_questions = [
             "What are your greatest strengths as a software developer?",
             "Describe a challenging project you worked on and how you overcame obstacles.",
             "How do you stay updated with the latest technology trends?"
         ]
-        
-        for i, question in enumerate(test_questions):
+
+        async def ask_question(i, question):
             try:
                 print(f"  Testing AI response for question {i+1}...")
-                response = requests.post(
-                    f"{BACKEND_URL}/interview/ai-response",
-                    json={"session_id": self.session_id, "question": question},
-                    timeout=30  # AI responses may take time
-                )
-                
+                async with self.ai_semaphore:
+                    response = await self.client.post(
+                        f"{BACKEND_URL}/interview/ai-response",
+                        json={"session_id": self.session_id, "question": question},
+                        timeout=30  # AI responses may take time
+                    )
+
                 if response.status_code == 200:
                     ai_data = response.json()
                     if all(key in ai_data for key in ["id", "session_id", "question", "response", "timestamp"]):
@@ -171,16 +182,14 @@ class InterviewCopilotTester:
                         self.log_result("ai_integration", f"AI response generation {i+1}", False, "Missing required fields in AI response")
                 else:
                     self.log_result("ai_integration", f"AI response generation {i+1}", False, f"HTTP {response.status_code}: {response.text}")
-                
-                # Add delay between AI requests to avoid rate limiting
-                time.sleep(2)
-                
             except Exception as e:
                 self.log_result("ai_integration", f"AI response generation {i+1}", False, str(e))
-        
+
+        await asyncio.gather(*[ask_question(i, q) for i, q in enumerate(test_questions)])
+
         # Test: Get AI responses for session
         try:
-            response = requests.get(f"{BACKEND_URL}/interview/ai-responses/{self.session_id}")
+            response = await self.client.get(f"{BACKEND_URL}/interview/ai-responses/{self.session_id}")
             if response.status_code == 200:
                 ai_responses = response.json()
                 if isinstance(ai_responses, list) and len(ai_responses) > 0:
@@ -191,53 +200,60 @@ class InterviewCopilotTester:
                 self.log_result("ai_integration", "Get session AI responses", False, f"HTTP {response.status_code}: {response.text}")
         except Exception as e:
             self.log_result("ai_integration", "Get session AI responses", False, str(e))
-    
-    def test_error_handling(self):
+
+    async def test_error_handling(self):
         """Test error handling scenarios"""
         print("\n🔍 Testing Error Handling...")
-        
-        # Test 1: Get non-existent session
-        try:
-            response = requests.get(f"{BACKEND_URL}/interview/session/non-existent-id")
-            if response.status_code == 404:
-                self.log_result("error_handling", "Non-existent session returns 404", True)
-            else:
-                self.log_result("error_handling", "Non-existent session returns 404", False, f"Expected 404, got {response.status_code}")
-        except Exception as e:
-            self.log_result("error_handling", "Non-existent session returns 404", False, str(e))
-        
-        # Test 2: Add transcript to non-existent session
-        try:
-            response = requests.post(
-                f"{BACKEND_URL}/interview/transcript",
-                json={"session_id": "non-existent-id", "text": "Test transcript", "speaker": "interviewer"}
-            )
-            if response.status_code == 404:
-                self.log_result("error_handling", "Transcript for non-existent session returns 404", True)
-            else:
-                self.log_result("error_handling", "Transcript for non-existent session returns 404", False, f"Expected 404, got {response.status_code}")
-        except Exception as e:
-            self.log_result("error_handling", "Transcript for non-existent session returns 404", False, str(e))
-        
-        # Test 3: AI response for non-existent session
-        try:
-            response = requests.post(
-                f"{BACKEND_URL}/interview/ai-response",
-                json={"session_id": "non-existent-id", "question": "Test question"}
-            )
-            if response.status_code == 404:
-                self.log_result("error_handling", "AI response for non-existent session returns 404", True)
-            else:
-                self.log_result("error_handling", "AI response for non-existent session returns 404", False, f"Expected 404, got {response.status_code}")
-        except Exception as e:
-            self.log_result("error_handling", "AI response for non-existent session returns 404", False, str(e))
-    
-    def test_basic_connectivity(self):
+
+        # All three negative-path requests are independent — fan them out
+        async def nonexistent_session():
+            try:
+                response = await self.client.get(f"{BACKEND_URL}/interview/session/non-existent-id")
+                if response.status_code == 404:
+                    self.log_result("error_handling", "Non-existent session returns 404", True)
+                else:
+                    self.log_result("error_handling", "Non-existent session returns 404", False, f"Expected 404, got {response.status_code}")
+            except Exception as e:
+                self.log_result("error_handling", "Non-existent session returns 404", False, str(e))
+
+        async def transcript_for_nonexistent_session():
+            try:
+                response = await self.client.post(
+                    f"{BACKEND_URL}/interview/transcript",
+                    json={"session_id": "non-existent-id", "text": "Test transcript", "speaker": "interviewer"}
+                )
+                if response.status_code == 404:
+                    self.log_result("error_handling", "Transcript for non-existent session returns 404", True)
+                else:
+                    self.log_result("error_handling", "Transcript for non-existent session returns 404", False, f"Expected 404, got {response.status_code}")
+            except Exception as e:
+                self.log_result("error_handling", "Transcript for non-existent session returns 404", False, str(e))
+
+        async def ai_response_for_nonexistent_session():
+            try:
+                response = await self.client.post(
+                    f"{BACKEND_URL}/interview/ai-response",
+                    json={"session_id": "non-existent-id", "question": "Test question"}
+                )
+                if response.status_code == 404:
+                    self.log_result("error_handling", "AI response for non-existent session returns 404", True)
+                else:
+                    self.log_result("error_handling", "AI response for non-existent session returns 404", False, f"Expected 404, got {response.status_code}")
+            except Exception as e:
+                self.log_result("error_handling", "AI response for non-existent session returns 404", False, str(e))
+
+        await asyncio.gather(
+            nonexistent_session(),
+            transcript_for_nonexistent_session(),
+            ai_response_for_nonexistent_session()
+        )
+
+    async def test_basic_connectivity(self):
         """Test basic API connectivity"""
         print("\n🔍 Testing Basic API Connectivity...")
-        
+
         try:
-            response = requests.get(f"{BACKEND_URL}/", timeout=10)
+            response = await self.client.get(f"{BACKEND_URL}/", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if "message" in data:
@@ -252,61 +268,68 @@ class InterviewCopilotTester:
         except Exception as e:
             print(f"❌ Basic API connectivity failed: {str(e)}")
             return False
-    
-    def run_all_tests(self):
+
+    async def run_all_tests(self):
         """Run all backend tests"""
         print("🚀 Starting Interview Copilot Backend API Tests")
         print(f"Backend URL: {BACKEND_URL}")
         print("=" * 60)
-        
+
         # Test basic connectivity first
-        if not self.test_basic_connectivity():
+        if not await self.test_basic_connectivity():
             print("\n❌ Basic connectivity failed. Aborting tests.")
             return False
-        
-        # Run all test suites
-        self.test_session_management()
-        self.test_transcript_management()
-        self.test_ai_integration()
-        self.test_error_handling()
-        
+
+        # Run all test suites; suites share state (session_id), so they stay
+        # ordered while the independent requests inside each suite fan out
+        await self.test_session_management()
+        await self.test_transcript_management()
+        await self.test_ai_integration()
+        await self.test_error_handling()
+
         # Print summary
         self.print_summary()
-        
+
         return self.is_overall_success()
-    
+
     def print_summary(self):
         """Print test results summary"""
         print("\n" + "=" * 60)
         print("📊 TEST RESULTS SUMMARY")
         print("=" * 60)
-        
+
         total_passed = 0
         total_failed = 0
-        
+
         for category, results in self.test_results.items():
             passed = results["passed"]
             failed = results["failed"]
             total_passed += passed
             total_failed += failed
-            
+
             status = "✅ PASS" if failed == 0 else "❌ FAIL"
             print(f"{category.replace('_', ' ').title()}: {status} ({passed} passed, {failed} failed)")
-            
+
             if results["errors"]:
                 for error in results["errors"]:
                     print(f"  - {error}")
-        
+
         print("-" * 60)
         overall_status = "✅ ALL TESTS PASSED" if total_failed == 0 else f"❌ {total_failed} TESTS FAILED"
         print(f"OVERALL: {overall_status} ({total_passed} passed, {total_failed} failed)")
         print("=" * 60)
-    
+
     def is_overall_success(self):
         """Check if all tests passed"""
         return sum(results["failed"] for results in self.test_results.values()) == 0
 
+async def main():
+    # One shared client: connection pooling + HTTP/2 multiplexing over a
+    # single TCP connection instead of a handshake per request
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        tester = InterviewCopilotTester(client)
+        return await tester.run_all_tests()
+
 if __name__ == "__main__":
-    tester = InterviewCopilotTester()
-    success = tester.run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
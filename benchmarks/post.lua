@@ -0,0 +1,33 @@
+-- wrk script: POST realistic transcript bodies to /api/interview/transcript
+-- Usage: SESSION_ID=<id> wrk -t4 -c128 -d30s -s post.lua <base-url>
+-- Create the session first:
+--   curl -X POST $BASE_URL/api/interview/session -H 'Content-Type: application/json' -d '{}'
+
+local session_id = os.getenv("SESSION_ID") or "benchmark-session"
+
+local lines = {
+  "Tell me about yourself and your background in software development.",
+  "What's your experience with database design and optimization?",
+  "Describe a challenging project you worked on and how you overcame obstacles.",
+  "How do you handle disagreements with teammates about technical decisions?",
+  "Walk me through how you would design a URL shortener.",
+}
+
+local counter = 0
+
+request = function()
+  counter = counter + 1
+  local body = string.format(
+    '{"session_id":"%s","text":"%s","speaker":"interviewer"}',
+    session_id, lines[(counter % #lines) + 1]
+  )
+  return wrk.format("POST", "/api/interview/transcript",
+    {["Content-Type"] = "application/json"}, body)
+end
+
+done = function(summary, latency, requests)
+  io.write(string.format("p50 %.2fms  p90 %.2fms  p99 %.2fms\n",
+    latency:percentile(50) / 1000,
+    latency:percentile(90) / 1000,
+    latency:percentile(99) / 1000))
+end
@@ -19,18 +19,19 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
 import queue
+import re
 import time
 import json
 import os
+from collections import deque
 from datetime import datetime
 import logging
 import traceback
 
 # Audio processing imports
-import pyaudio
-import wave
+import sounddevice as sd
 import numpy as np
-import whisper
+from faster_whisper import WhisperModel, BatchedInferencePipeline
 import torch
 
 # API integration
@@ -51,20 +52,48 @@ class InterviewCopilot:
         self.audio_queue = queue.Queue()
         self.transcript_queue = queue.Queue()
         self.response_queue = queue.Queue()
+        self.status_changed = threading.Event()
+        self.stop_event = threading.Event()
         
         # Audio settings
         self.CHUNK = 1024
-        self.FORMAT = pyaudio.paInt16
-        self.CHANNELS = 2
+        # Whisper's front end is mono; capturing stereo only doubles the bytes
+        # moved from mic to model
+        self.CHANNELS = 1
         self.RATE = 16000
-        self.RECORD_SECONDS = 8  # Process audio in 3-second chunks
-        
+        self.SILENCE_RMS = 0.005  # Normalized RMS below this counts as silence
+        self.MAX_WINDOW_SECONDS = 15   # Hard cap before a window is force-emitted
+        self.MIN_WINDOW_SECONDS = 1.0  # Don't emit fragments shorter than this
+        self.HUSH_SECONDS = 0.3        # Trailing silence that ends an utterance
+
+        # Preallocated capture window filled by the PortAudio callback; no
+        # per-chunk Python allocations on the capture path. Windows are cut at
+        # the first hush (trailing silence) after speech rather than on a
+        # fixed 8-second boundary, so latency tracks the utterance.
+        self._window_frames = self.RATE * self.MAX_WINDOW_SECONDS
+        self._min_frames = int(self.RATE * self.MIN_WINDOW_SECONDS)
+        self._hush_frames_needed = int(self.RATE * self.HUSH_SECONDS)
+        self._capture_buf = np.empty(self._window_frames, dtype=np.int16)
+        # Reusable float32 scratch for the int16 -> normalized conversion in
+        # audio_processor; sized for a full window plus the drained backlog so
+        # the hot loop never allocates. Single consumer, so reuse is safe.
+        self._fbuf = np.empty(self._window_frames * 8, dtype=np.float32)
+        self._capture_pos = 0
+        self._voiced = False
+        self._hush_frames = 0
+        self._stream = None
+
         # State variables
         self.is_listening = False
         self.is_processing = False
         self.is_hidden = False
         self.current_session_id = None
-        self.transcript_history = []
+        # deque evicts old turns in O(1); older turns are folded into a
+        # one-line rolling summary instead of being resent verbatim
+        self.transcript_history = deque(maxlen=10)
+        self.session_summary = ""
+        self._evicted_texts = []
+        self.SUMMARY_EVERY = 5  # Refresh the summary every N evicted turns
         
         # Initialize AI components
         self.setup_whisper()
@@ -93,14 +122,30 @@ class InterviewCopilot:
     def setup_whisper(self):
         """Initialize Whisper model with GPU acceleration"""
         try:
-            device = "cuda" if torch.cuda.is_available() else "cpu"
+            use_cuda = torch.cuda.is_available()
+            device = "cuda" if use_cuda else "cpu"
+            # int8_float16 runs the same weights through CTranslate2's fused
+            # int8 matmuls — ~4x faster than openai-whisper at matched WER
+            compute_type = "int8_float16" if use_cuda else "int8"
             self.logger.info(f"Loading Whisper model on {device}")
-            
-            # Use small model for real-time performance, base for better accuracy
-            model_size = "medium.en" if torch.cuda.is_available() else "medium.en"
-            self.whisper_model = whisper.load_model(model_size, device=device)
-            
-            self.logger.info(f"Whisper model '{model_size}' loaded successfully on {device}")
+
+            model_size = "medium.en"
+            self.whisper_model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                num_workers=1
+            )
+
+            # Batched pipeline for draining transcription backlog: VAD-split
+            # segments ride one batched forward instead of serial launches
+            self.whisper_pipeline = BatchedInferencePipeline(model=self.whisper_model)
+
+            # 39M-param draft model on CPU: a cheap hypothesis decides whether
+            # a window is worth waking the medium model on the GPU at all
+            self.tiny_model = WhisperModel("tiny.en", device="cpu", compute_type="int8")
+
+            self.logger.info(f"Whisper model '{model_size}' loaded successfully on {device} ({compute_type})")
             
             # GPU info
             if torch.cuda.is_available():
@@ -356,211 +401,363 @@ Structure your response as:
             self.is_listening = True
             self.listen_button.config(text="🔴 Stop Listening", bg='#dc2626')
             self.status_label.config(text="🎤 Listening...", fg=self.colors['accent'])
-            
-            # Start audio capture
-            self.audio_capture_thread = threading.Thread(target=self.capture_audio, daemon=True)
-            self.audio_capture_thread.start()
-            
+
+            # Start audio capture; PortAudio drives the callback from its own
+            # thread, so there is no Python-side read loop. The stream is
+            # opened once and kept on self: device enumeration/open can take
+            # hundreds of ms on some hosts, so toggles only start()/stop() it.
+            self._capture_pos = 0
+            self._voiced = False
+            self._hush_frames = 0
+            if self._stream is None:
+                self._stream = sd.RawInputStream(
+                    samplerate=self.RATE,
+                    blocksize=self.CHUNK,
+                    dtype='int16',
+                    channels=self.CHANNELS,
+                    latency='low',
+                    callback=self.audio_callback
+                )
+            self._stream.start()
+            self.status_changed.set()
+
             self.logger.info("Started listening")
-            
+
         except Exception as e:
             self.logger.error(f"Failed to start listening: {e}")
             messagebox.showerror("Error", f"Failed to start listening: {e}")
             self.is_listening = False
-    
+
     def stop_listening(self):
         """Stop speech recognition"""
         self.is_listening = False
+        if self._stream is not None:
+            try:
+                # Stop but keep the stream open so the next start is instant
+                self._stream.stop()
+            except Exception as e:
+                self.logger.error(f"Failed to stop audio stream: {e}")
         self.listen_button.config(text="🎤 Start Listening", bg=self.colors['accent'])
         self.status_label.config(text="🔴 Ready to start", fg=self.colors['muted'])
+        self.status_changed.set()
         self.logger.info("Stopped listening")
-    
-    def capture_audio(self):
-        """Capture audio from microphone"""
-        try:
-            audio = pyaudio.PyAudio()
-            
-            stream = audio.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.RATE,
-                input=True,
-                frames_per_buffer=self.CHUNK
-            )
-            
-            self.logger.info("Audio capture started")
-            
-            while self.is_listening:
-                frames = []
-                for _ in range(0, int(self.RATE / self.CHUNK * self.RECORD_SECONDS)):
-                    if not self.is_listening:
-                        break
-                    data = stream.read(self.CHUNK)
-                    frames.append(data)
-                
-                if frames and self.is_listening:
-                    # Convert to numpy array
-                    audio_data = b''.join(frames)
-                    audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-                    
-                    # Add to processing queue
-                    self.audio_queue.put(audio_np)
-            
-            stream.stop_stream()
-            stream.close()
-            audio.terminate()
-            
-        except Exception as e:
-            self.logger.error(f"Audio capture error: {e}")
-            self.is_listening = False
+
+    def audio_callback(self, indata, frames, time_info, status):
+        """PortAudio callback: copy raw frames into the preallocated window"""
+        if status:
+            self.logger.warning(f"Audio callback status: {status}")
+        if not self.is_listening:
+            return
+
+        chunk = np.frombuffer(indata, dtype=np.int16)
+        end = min(self._capture_pos + len(chunk), self._window_frames)
+        n = end - self._capture_pos
+        self._capture_buf[self._capture_pos:end] = chunk[:n]
+        self._capture_pos = end
+
+        # Track trailing silence to find the hush point
+        chunk_rms = np.sqrt(np.mean(np.square(chunk, dtype=np.float64))) / 32768.0
+        if chunk_rms >= self.SILENCE_RMS:
+            self._voiced = True
+            self._hush_frames = 0
+        else:
+            self._hush_frames += len(chunk)
+
+        hushed = self._voiced and self._hush_frames >= self._hush_frames_needed
+        if hushed and self._capture_pos >= self._min_frames:
+            self.emit_window()
+        elif self._capture_pos >= self._window_frames:
+            if self._voiced:
+                self.emit_window()
+            else:
+                # Nothing but silence accumulated; just rewind
+                self._capture_pos = 0
+                self._hush_frames = 0
+
+    def emit_window(self):
+        """Cut the current window and queue it for transcription
+
+        The queue carries int16 — half the bytes of float32 — and the
+        transcription thread converts once, right before the model call.
+        """
+        self.audio_queue.put(self._capture_buf[:self._capture_pos].copy())
+        self._capture_pos = 0
+        self._voiced = False
+        self._hush_frames = 0
     
     def audio_processor(self):
         """Process audio data with Whisper"""
-        while True:
+        while not self.stop_event.is_set():
             try:
-                if not self.audio_queue.empty():
-                    audio_data = self.audio_queue.get()
-                    
-                    # Process with Whisper
-                    result = self.whisper_model.transcribe(
-                        audio_data,
-                        language='en',
-                        fp16=torch.cuda.is_available()
-                    )
-                    
-                    text = result['text'].strip()
-                    if text and len(text) > 2:  # Filter out very short utterances
-                        self.transcript_queue.put({
-                            'text': text,
-                            'timestamp': datetime.now(),
-                            'confidence': 1.0  # Whisper doesn't provide confidence
-                        })
-                
-                time.sleep(0.1)
-                
+                # Block until a window arrives; the OS wakes this thread on
+                # work instead of a 100 ms poll
+                try:
+                    audio_data = self.audio_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+
+                # Drain any backlog so queued windows share one batched
+                # forward instead of serial per-window launches
+                backlog = []
+                while not self.audio_queue.empty() and len(backlog) < 7:
+                    try:
+                        backlog.append(self.audio_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if backlog:
+                    audio_data = np.concatenate([audio_data] + backlog)
+
+                # Skip windows with no speech energy: one vectorized RMS
+                # pass is orders of magnitude cheaper than an encoder
+                # forward over 8 seconds of silence. Done on the int16
+                # samples so silent windows never get converted at all.
+                rms = np.sqrt(np.mean(np.square(audio_data, dtype=np.float64))) / 32768.0
+                if rms < self.SILENCE_RMS:
+                    continue
+
+                # One fused int16 -> normalized float32 pass into the
+                # preallocated scratch buffer: no astype temporary, no second
+                # divide pass, zero heap traffic per window
+                np.multiply(audio_data, np.float32(1.0 / 32768.0),
+                            out=self._fbuf[:audio_data.size], casting='unsafe')
+                audio_data = self._fbuf[:audio_data.size]
+
+                # CPU draft pass: short acknowledgments ("right", "okay")
+                # are emitted from the tiny hypothesis directly; only
+                # question-like or substantial windows pay for a medium.en
+                # decode on the GPU
+                draft_segments, _ = self.tiny_model.transcribe(
+                    audio_data,
+                    language='en',
+                    beam_size=1,
+                    best_of=1,
+                    temperature=0.0,
+                    without_timestamps=True,
+                    vad_filter=True,
+                    condition_on_previous_text=False
+                )
+                draft = " ".join(s.text.strip() for s in draft_segments).strip()
+                if not draft:
+                    continue
+
+                if self.is_question(draft) or len(draft.split()) > 6:
+                    # Full decode; greedy, Silero VAD trims non-speech
+                    # before the encoder sees it
+                    if backlog:
+                        segments, _ = self.whisper_pipeline.transcribe(
+                            audio_data,
+                            language='en',
+                            beam_size=1,
+                            best_of=1,
+                            temperature=0.0,
+                            without_timestamps=True,
+                            batch_size=8,
+                            condition_on_previous_text=False
+                        )
+                    else:
+                        segments, _ = self.whisper_model.transcribe(
+                            audio_data,
+                            language='en',
+                            beam_size=1,
+                            best_of=1,
+                            temperature=0.0,
+                            without_timestamps=True,
+                            no_speech_threshold=0.6,
+                            vad_filter=True,
+                            condition_on_previous_text=False
+                        )
+                    text = " ".join(s.text.strip() for s in segments).strip()
+                else:
+                    text = draft
+                if text and len(text) > 2:  # Filter out very short utterances
+                    self.transcript_queue.put({
+                        'text': text,
+                        'timestamp': datetime.now(),
+                        'confidence': 1.0  # Whisper doesn't provide confidence
+                    })
+
             except Exception as e:
                 self.logger.error(f"Audio processing error: {e}")
                 time.sleep(1)
     
     def transcript_processor(self):
         """Process transcripts and generate AI responses"""
-        while True:
+        while not self.stop_event.is_set():
             try:
-                if not self.transcript_queue.empty():
-                    transcript_data = self.transcript_queue.get()
-                    text = transcript_data['text']
-                    
-                    # Add to conversation history
-                    self.transcript_history.append(transcript_data)
-                    
-                    # Keep only last 10 entries
-                    if len(self.transcript_history) > 10:
-                        self.transcript_history.pop(0)
-                    
-                    # Update transcript display
-                    self.update_transcript_display(text)
-                    
-                    # Generate AI response if this looks like a question
-                    if self.is_question(text):
-                        self.generate_ai_response(text)
-                
-                time.sleep(0.1)
-                
+                try:
+                    transcript_data = self.transcript_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                text = transcript_data['text']
+
+                # Add to conversation history; the deque evicts the oldest
+                # turn, which we stage for the rolling summary
+                if len(self.transcript_history) == self.transcript_history.maxlen:
+                    self._evicted_texts.append(self.transcript_history[0]['text'])
+                self.transcript_history.append(transcript_data)
+
+                if len(self._evicted_texts) >= self.SUMMARY_EVERY:
+                    evicted, self._evicted_texts = self._evicted_texts, []
+                    threading.Thread(
+                        target=self.update_session_summary,
+                        args=("\n".join(evicted),),
+                        daemon=True
+                    ).start()
+
+                # Update transcript display
+                self.update_transcript_display(text)
+
+                # Generate AI response if this looks like a question
+                if self.is_question(text):
+                    self.generate_ai_response(text)
+
             except Exception as e:
                 self.logger.error(f"Transcript processing error: {e}")
                 time.sleep(1)
     
+    # Compiled once: one C-level scan with case folding replaces a lower()
+    # copy plus eleven Python substring searches per transcript
+    _QUESTION_RE = re.compile(
+        r'\?|\b(?:what|how|why|when|where|who|describe|explain)\b'
+        r'|\bcan you\b|\btell me\b',
+        re.IGNORECASE
+    )
+
     def is_question(self, text):
         """Simple heuristic to determine if text is a question"""
-        question_indicators = ['?', 'what', 'how', 'why', 'when', 'where', 'who', 'can you', 'tell me', 'describe', 'explain']
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in question_indicators) or len(text) > 20
+        return self._QUESTION_RE.search(text) is not None or len(text) > 20
     
+    def update_session_summary(self, evicted_text):
+        """Fold evicted transcript turns into the one-line session summary"""
+        try:
+            prompt = "Summarize this interview conversation in one sentence, keeping facts worth referencing later:\n"
+            if self.session_summary:
+                prompt += f"Summary so far: {self.session_summary}\n"
+            prompt += evicted_text
+            result = self.gemini_model.generate_content(prompt)
+            self.session_summary = result.text.strip()
+        except Exception as e:
+            self.logger.error(f"Summary generation error: {e}")
+
     def generate_ai_response(self, question):
         """Generate AI response using Gemini"""
         try:
             self.is_processing = True
+            self.status_changed.set()
             self.status_label.config(text="🤖 Generating response...", fg='#f59e0b')
-            
-            # Build context from recent conversation
-            context = "Recent conversation:\n"
-            for entry in self.transcript_history[-5:]:  # Last 5 entries
-                context += f"- {entry['text']}\n"
-            
+
+            # Build context: one summary line stands in for everything older
+            # than the last few turns, keeping prompt tokens flat over time
+            context_lines = []
+            if self.session_summary:
+                context_lines.append(f"Earlier in the interview: {self.session_summary}")
+            context_lines.extend(f"- {entry['text']}" for entry in list(self.transcript_history)[-5:])
+            context = "Recent conversation:\n" + "\n".join(context_lines)
+
             full_prompt = f"{context}\n\nCurrent question: {question}\n\nPlease provide a professional interview response:"
-            
-            response = self.chat.send_message(full_prompt)
-            
-            self.response_queue.put({
-                'question': question,
-                'response': response.text,
-                'timestamp': datetime.now()
-            })
-            
+
+            # Stream tokens to the GUI as they arrive; the user starts
+            # reading at first-token latency instead of waiting out the
+            # full 1024-token generation
+            response = self.chat.send_message(full_prompt, stream=True)
+
+            first_chunk = True
+            for chunk in response:
+                if not chunk.text:
+                    continue
+                self.response_queue.put({
+                    'question': question,
+                    'response': chunk.text,
+                    'timestamp': datetime.now(),
+                    'partial': not first_chunk  # First chunk replaces the old answer
+                })
+                first_chunk = False
+
         except Exception as e:
             self.logger.error(f"AI response generation error: {e}")
             self.response_queue.put({
                 'question': question,
                 'response': f"Error generating response: {str(e)}",
-                'timestamp': datetime.now()
+                'timestamp': datetime.now(),
+                'partial': False
             })
         finally:
             self.is_processing = False
+            self.status_changed.set()
             self.status_label.config(text="🎤 Listening...", fg=self.colors['accent'])
     
     def response_processor(self):
         """Process AI responses"""
-        while True:
+        while not self.stop_event.is_set():
             try:
-                if not self.response_queue.empty():
-                    response_data = self.response_queue.get()
-                    self.update_response_display(response_data['response'])
-                
-                time.sleep(0.1)
-                
+                try:
+                    response_data = self.response_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                self.update_response_display(
+                    response_data['response'],
+                    partial=response_data.get('partial', False)
+                )
+
             except Exception as e:
                 self.logger.error(f"Response processing error: {e}")
                 time.sleep(1)
     
     def update_transcript_display(self, text):
         """Update transcript display in GUI"""
-        def update():
-            self.transcript_text.delete(1.0, tk.END)
-            self.transcript_text.insert(tk.END, text)
-            self.transcript_text.see(tk.END)
-        
-        self.root.after(0, update)
-    
-    def update_response_display(self, response):
+        # Marshal via after() with a bound method + argument; building a fresh
+        # closure per transcript event is allocation churn the Tk queue
+        # doesn't need
+        self.root.after(0, self.render_transcript, text)
+
+    def render_transcript(self, text):
+        """Render transcript text (Tk thread only)"""
+        # Single replace: one Tcl call and one layout pass instead of the
+        # delete+insert pair, which also flickered on frequent updates
+        self.transcript_text.replace('1.0', tk.END, text)
+        self.transcript_text.see(tk.END)
+
+    def update_response_display(self, response, partial=False):
         """Update AI response display in GUI"""
-        def update():
-            self.response_text.delete(1.0, tk.END)
+        self.root.after(0, self.render_response, response, partial)
+
+    def render_response(self, response, partial=False):
+        """Render AI response text (Tk thread only)
+
+        Streamed chunks append; the first chunk of a new answer replaces the
+        previous one.
+        """
+        if partial:
             self.response_text.insert(tk.END, response)
-            self.response_text.see(tk.END)
-        
-        self.root.after(0, update)
-    
+        else:
+            self.response_text.replace('1.0', tk.END, response)
+        self.response_text.see(tk.END)
+
+    def render_status(self, status):
+        """Render status text (Tk thread only)"""
+        self.status_label.config(text=status)
+
     def gui_updater(self):
         """Update GUI elements periodically"""
-        while True:
+        while not self.stop_event.is_set():
             try:
-                # Update queue sizes in status
+                # Wake immediately on state changes, else refresh the queue
+                # counter once a second
+                self.status_changed.wait(timeout=1.0)
+                self.status_changed.clear()
+
+                # Build the status string on this thread; the Tk thread only
+                # runs the config call
                 if hasattr(self, 'status_label'):
-                    def update_status():
-                        if self.is_processing:
-                            status = "🤖 Processing..."
-                        elif self.is_listening:
-                            status = f"🎤 Listening... (Q:{self.audio_queue.qsize()})"
-                        else:
-                            status = "🔴 Ready to start"
-                        
-                        if hasattr(self, 'status_label'):
-                            self.status_label.config(text=status)
-                    
-                    self.root.after(0, update_status)
-                
-                time.sleep(1)
-                
+                    if self.is_processing:
+                        status = "🤖 Processing..."
+                    elif self.is_listening:
+                        status = f"🎤 Listening... (Q:{self.audio_queue.qsize()})"
+                    else:
+                        status = "🔴 Ready to start"
+
+                    self.root.after(0, self.render_status, status)
+
             except Exception as e:
                 self.logger.error(f"GUI update error: {e}")
                 time.sleep(5)
@@ -580,8 +777,23 @@ Structure your response as:
     def on_closing(self):
         """Handle application closing"""
         self.logger.info("Shutting down Interview Copilot")
-        self.is_listening = False
-        time.sleep(0.5)  # Allow threads to finish
+        if self.is_listening:
+            self.stop_listening()
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as e:
+                self.logger.error(f"Failed to close audio stream: {e}")
+            self._stream = None
+
+        # Signal the worker loops and give each a bounded join instead of
+        # hoping a fixed sleep outlasts them
+        self.stop_event.set()
+        self.status_changed.set()
+        for thread in (self.audio_thread, self.transcript_thread,
+                       self.response_thread, self.gui_thread):
+            thread.join(timeout=0.2)
+
         self.root.destroy()
     
     def run(self):
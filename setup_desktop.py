@@ -63,11 +63,11 @@ def install_pytorch():
         return result is not None
 
 def install_whisper():
-    """Install OpenAI Whisper"""
-    print("Installing OpenAI Whisper...")
-    result = run_command("pip install openai-whisper")
+    """Install faster-whisper (CTranslate2 Whisper backend)"""
+    print("Installing faster-whisper...")
+    result = run_command("pip install faster-whisper")
     if result is not None:
-        print("✅ Whisper installed successfully")
+        print("✅ faster-whisper installed successfully")
         return True
     return False
 
@@ -75,23 +75,13 @@ def install_audio_dependencies():
     """Install audio processing dependencies"""
     print("Installing audio dependencies...")
     
-    # Platform-specific audio libraries
-    if platform.system() == "Windows":
-        commands = [
-            "pip install pyaudio",
-            "pip install sounddevice"
-        ]
-    elif platform.system() == "Darwin":  # macOS
-        commands = [
-            "pip install pyaudio",
-            "pip install sounddevice"
-        ]
-    else:  # Linux
-        print("On Linux, you may need to install: sudo apt-get install python3-pyaudio portaudio19-dev")
-        commands = [
-            "pip install pyaudio",
-            "pip install sounddevice"
-        ]
+    # sounddevice bundles PortAudio wheels on Windows/macOS; Linux needs the
+    # system library
+    if platform.system() == "Linux":
+        print("On Linux, you may need to install: sudo apt-get install portaudio19-dev")
+    commands = [
+        "pip install sounddevice"
+    ]
     
     for cmd in commands:
         result = run_command(cmd, check=False)